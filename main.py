@@ -1,4 +1,5 @@
 import streamlit as st
+from utils.assets import load_asset
 
 dashboard = st.Page(
     page="pages/Dashboard.py",
@@ -26,6 +27,6 @@ pg = st.navigation(
     }
 )
 
-st.logo("assets/logo.png", size="large")
+st.logo(load_asset("assets/logo.png", 108), size="large")
 
 pg.run()
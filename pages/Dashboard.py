@@ -3,8 +3,9 @@ import pandas as pd
 import plotly.express as px
 import numpy as np
 import plotly.graph_objects as go
-import gdown
 import os
+from utils.crosstab import CROSSTAB_DIMENSIONS, crosstab_frame, encode_dimensions
+from utils.dataset import DownloadError, HTTPSource, fetch_dataset
 
 RED_COLOR_SCALE = px.colors.sequential.Reds # Untuk Bar, Heatmap, dan Peta Kepadatan
 RED_LINE_COLOR = '#E3170D' # Warna Merah Solid untuk Garis
@@ -57,26 +58,37 @@ def load_data(file_path):
                                         include_lowest=True).astype(str).replace('nan', 'Not Specified')
 
         # Drop baris dengan koordinat (latitude, longitude) yang nol atau tidak valid
-        df = df[(df['latitude'] != 0) & (df['longitude'] != 0)]
+        df = df[(df['latitude'] != 0) & (df['longitude'] != 0)].copy()
+
+        # Kode integer untuk tabulasi silang (dibuat sekali, ikut ter-cache)
+        dimension_labels = encode_dimensions(df, CROSSTAB_DIMENSIONS)
         
-        return df
+        return df, dimension_labels
     except FileNotFoundError:
         st.error(f"File **{file_path}** tidak ditemukan. Pastikan file berada di direktori yang sama.")
-        return pd.DataFrame()
+        return pd.DataFrame(), {}
     except Exception as e:
         st.error(f"Terjadi kesalahan saat memproses data: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), {}
 
-model_dir = "dataset"
 FILE_PATH = 'dataset/crime_data_clean.csv'
+DATASET_URL = os.environ.get(
+    "DATASET_URL",
+    "https://drive.usercontent.google.com/download?id=1rUX8TfaP0Mr3MdmNHkOg8-DvYgGzV2wD&export=download&confirm=t",
+)
+# SHA-256 dataset (opsional). Tanpa ini, kelengkapan unduhan diperiksa dari
+# ukuran file atau framing chunked yang dikirim server.
+DATASET_SHA256 = os.environ.get("DATASET_SHA256")
 
 if not os.path.exists(FILE_PATH):
-    st.info("Mengunduh dataset...")
-    os.makedirs(model_dir, exist_ok=True)
-    url = "https://drive.google.com/uc?id=1rUX8TfaP0Mr3MdmNHkOg8-DvYgGzV2wD"
-    gdown.download(url, FILE_PATH, quiet=False)
+    try:
+        with st.spinner("Mengunduh dataset..."):
+            fetch_dataset(HTTPSource(DATASET_URL), FILE_PATH, sha256=DATASET_SHA256)
+    except (OSError, DownloadError) as e:
+        st.error(f"Gagal mengunduh dataset: {e}")
+        st.stop()
 
-df = load_data(FILE_PATH)
+df, dimension_labels = load_data(FILE_PATH)
 
 if df.empty:
     st.stop()
@@ -547,29 +559,60 @@ with col12:
     )
     st.plotly_chart(fig_weapon, use_container_width=True)
 
-# Hubungan antara jenis tempat kejadian dengan jenis kejahatan (Heatmap)
+# Hubungan antara dua dimensi pilihan pengguna (Heatmap)
 with col13:
-    df_cross = pd.crosstab(df_final['premise'], df_final['crime_category'])
-    
-    top_premises = df_final['premise'].value_counts().head(10).index
-    df_cross_filtered = df_cross.loc[top_premises]
-
-    fig_heatmap = px.imshow(
-        df_cross_filtered, 
-        text_auto=True,
-        aspect="auto",
-        labels=dict(x="Kategori Kejahatan", y="Tempat Kejadian (Premise)", color="Jumlah Kejahatan"),
-        x=df_cross_filtered.columns.tolist(),
-        y=df_cross_filtered.index.tolist(),
-        color_continuous_scale=RED_COLOR_SCALE,
-        title='Hubungan Jenis Tempat Kejadian vs Kategori Kejahatan'
-    )
-    fig_heatmap.update_xaxes(tickangle=45)
-    fig_heatmap.update_layout(
-        title={
-            'text': fig_heatmap.layout.title.text,
-            'x': 0.5,
-            'xanchor': 'center'
-        }
-    )
-    st.plotly_chart(fig_heatmap, use_container_width=True)
+    dimension_options = [col for col in CROSSTAB_DIMENSIONS if col in dimension_labels]
+
+    col_row_dim, col_col_dim, col_top_k = st.columns([2, 2, 1])
+    with col_row_dim:
+        row_dim = st.selectbox(
+            "Baris",
+            options=dimension_options,
+            index=dimension_options.index('premise') if 'premise' in dimension_options else 0,
+            format_func=CROSSTAB_DIMENSIONS.get,
+            key="crosstab_row_dim",
+        )
+    with col_col_dim:
+        col_dim = st.selectbox(
+            "Kolom",
+            options=dimension_options,
+            index=dimension_options.index('crime_category') if 'crime_category' in dimension_options else 0,
+            format_func=CROSSTAB_DIMENSIONS.get,
+            key="crosstab_col_dim",
+        )
+    with col_top_k:
+        top_k = st.number_input("Top-k", min_value=1, max_value=50, value=10, key="crosstab_top_k")
+
+    if row_dim == col_dim:
+        st.warning("Pilih dua dimensi yang berbeda untuk tabulasi silang.")
+    else:
+        # Hanya baris & kolom top-k yang dihitung, langsung dari kolom kode integer
+        df_cross_filtered = crosstab_frame(
+            df_final, dimension_labels, row_dim, col_dim, k_rows=top_k, k_cols=top_k
+        )
+
+        if df_cross_filtered.empty:
+            st.info("Tidak ada data untuk tabulasi silang dengan filter saat ini.")
+        else:
+            row_label = CROSSTAB_DIMENSIONS[row_dim]
+            col_label = CROSSTAB_DIMENSIONS[col_dim]
+
+            fig_heatmap = px.imshow(
+                df_cross_filtered, 
+                text_auto=True,
+                aspect="auto",
+                labels=dict(x=col_label, y=row_label, color="Jumlah Kejahatan"),
+                x=[str(label) for label in df_cross_filtered.columns],
+                y=[str(label) for label in df_cross_filtered.index],
+                color_continuous_scale=RED_COLOR_SCALE,
+                title=f'Hubungan {row_label} vs {col_label}'
+            )
+            fig_heatmap.update_xaxes(tickangle=45)
+            fig_heatmap.update_layout(
+                title={
+                    'text': fig_heatmap.layout.title.text,
+                    'x': 0.5,
+                    'xanchor': 'center'
+                }
+            )
+            st.plotly_chart(fig_heatmap, use_container_width=True)
@@ -1,4 +1,5 @@
 import streamlit as st
+from utils.assets import load_asset
 
 def local_css(file_name):
     """Membaca file CSS lokal dan menyuntikkannya ke Streamlit."""
@@ -41,7 +42,7 @@ def page_contact():
     try:
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            st.image(logo_kelompok, width=520)
+            st.image(load_asset(logo_kelompok, 520), width=520)
     except FileNotFoundError:
         st.warning("Gagal memuat logo kelompok. Pastikan path file benar.")
     
@@ -56,7 +57,7 @@ def page_contact():
         with cols[i]:
             # Foto Profil
             try:
-                st.image(member["foto"], width=150)
+                st.image(load_asset(member["foto"], 150), width=150)
             except FileNotFoundError:
                 st.error(f"Foto {member['nama']} tidak ditemukan.")
             
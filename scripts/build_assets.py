@@ -0,0 +1,103 @@
+"""Membuat varian aset gambar yang sudah diperkecil dan dikompresi ulang.
+
+Setiap aset pada ``ASSET_WIDTHS`` di-resize ke lebar tampilannya (dikali
+``RENDER_SCALE``), lalu disimpan sebagai WebP dengan nama berisi hash
+konten di ``assets/build``. Pemetaan nama asli -> varian ditulis ke
+``assets/build/manifest.json`` dan dibaca oleh ``utils.assets``.
+
+Jalankan dari root repositori:
+
+    python scripts/build_assets.py
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.assets import ASSET_DIR, ASSET_WIDTHS, BUILD_DIR, MANIFEST_PATH, RENDER_SCALE
+
+
+def encode(image):
+    """Mengompresi gambar ke WebP dan mengembalikan bytes-nya."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=85, method=6)
+    return buffer.getvalue()
+
+
+def variant_pattern(stems):
+    """Pola nama file varian ``<stem>-<w>w.<hash>.<fmt>`` untuk stem yang dikenal."""
+    names = "|".join(re.escape(stem) for stem in stems)
+    return re.compile(rf"^(?:{names})-\d+w\.[0-9a-f]{{10}}\.(?:webp|png)$")
+
+
+def build_variant(src_path, width, out_dir):
+    """Membuat varian WebP untuk satu aset pada satu lebar tampilan."""
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+
+    with Image.open(src_path) as image:
+        image.load()
+        # Tidak pernah memperbesar gambar melebihi ukuran aslinya
+        target_width = min(width * RENDER_SCALE, image.width)
+        target_height = max(1, round(image.height * target_width / image.width))
+        resized = image.resize((target_width, target_height), Image.LANCZOS)
+
+    data = encode(resized)
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    name = f"{stem}-{width}w.{digest}.webp"
+    with open(os.path.join(out_dir, name), "wb") as f:
+        f.write(data)
+
+    return name
+
+
+def build_assets(src_dir=ASSET_DIR, out_dir=BUILD_DIR, manifest_path=MANIFEST_PATH):
+    """Membangun semua varian aset dan menulis manifest-nya."""
+    if os.path.realpath(src_dir) == os.path.realpath(out_dir):
+        raise ValueError("Direktori output varian tidak boleh sama dengan direktori aset asli.")
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {}
+
+    for name, widths in ASSET_WIDTHS.items():
+        src_path = os.path.join(src_dir, name)
+        manifest[name] = {str(width): build_variant(src_path, width, out_dir) for width in widths}
+
+    # Hapus varian lama yang tidak lagi direferensikan; file lain tidak disentuh
+    current = {variant for entry in manifest.values() for variant in entry.values()}
+    pattern = variant_pattern(os.path.splitext(name)[0] for name in ASSET_WIDTHS)
+    for existing in os.listdir(out_dir):
+        path = os.path.join(out_dir, existing)
+        if existing not in current and pattern.match(existing) and os.path.isfile(path):
+            os.remove(path)
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build varian aset gambar teroptimasi ke assets/build.")
+    parser.add_argument("--src", default=ASSET_DIR, help="Direktori aset asli.")
+    args = parser.parse_args()
+
+    # Output selalu BUILD_DIR karena hanya lokasi itu yang dibaca utils.assets
+    manifest = build_assets(args.src, BUILD_DIR, MANIFEST_PATH)
+
+    for name, entry in manifest.items():
+        original = os.path.getsize(os.path.join(args.src, name))
+        for width, variant in entry.items():
+            size = os.path.getsize(os.path.join(BUILD_DIR, variant))
+            print(f"{name} @ {width}px ({original / 1024:.1f} KB): webp={size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""Load test headless untuk aplikasi Streamlit.
+
+Menjalankan satu server ``streamlit run main.py`` lalu menghubungkan banyak
+sesi websocket bersamaan ke ``/_stcore/stream``, persis seperti browser.
+Setiap sesi memutar ulang urutan interaksi acak yang realistis (ubah rentang
+tanggal, multiselect filter, dimensi heatmap, pindah halaman) dengan mengirim
+``BackMsg.rerun_script`` berisi state widget, lalu menunggu
+``ForwardMsg.script_finished``.
+
+Yang dilaporkan:
+
+- cold start: rerun pertama server (cache ``st.cache_data`` masih kosong);
+- page load: rerun awal tiap sesi setelah cache hangat;
+- latensi rerun interaktif p50/p95/p99 dan throughput server;
+- puncak memori proses server dan proses harness.
+
+Gate ``--max-p95`` hanya memakai latensi rerun interaktif.
+
+Contoh (dari root repositori):
+
+    python scripts/loadtest.py --sessions 50 --actions 10
+    python scripts/loadtest.py --sessions 20 --max-p95 5 --json hasil.json
+    python scripts/loadtest.py --url http://localhost:8501 --sessions 10
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MULTISELECT_LABELS = ["Pilih Area", "Pilih Kategori Kejahatan", "Pilih Gender Korban"]
+CROSSTAB_KEYS = ["crosstab_row_dim", "crosstab_col_dim"]
+OTHER_PAGES = ["Tentang", "Kontak"]
+DASHBOARD_PAGE = "Dashboard"
+WIDGET_TYPES = ("date_input", "multiselect", "selectbox", "number_input")
+
+# Aksi awal yang tidak termasuk latensi interaktif
+COLD_START = "cold_start"
+PAGE_LOAD = "page_load"
+
+
+def percentile(values, q):
+    """Persentil ``q`` (0-100) dengan metode nearest-rank."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = min(max(1, math.ceil(q / 100 * len(ordered))), len(ordered))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb(pid=None):
+    """Puncak resident memory sebuah proses dalam MB (``None`` jika tidak tersedia)."""
+    if pid is None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss dalam KB di Linux, dalam byte di macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app_root=ROOT, port=None, timeout=60.0):
+    """Menjalankan ``streamlit run main.py`` dan menunggu hingga server sehat.
+
+    Mengembalikan ``(process, base_url)``.
+    """
+    port = port or free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "main.py",
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=app_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server Streamlit berhenti dengan kode {process.returncode}.")
+        try:
+            with urllib.request.urlopen(f"{base_url}/_stcore/health", timeout=2) as response:
+                if response.status == 200:
+                    return process, base_url
+        except OSError:
+            time.sleep(0.5)
+
+    stop_server(process)
+    raise RuntimeError(f"Server Streamlit tidak siap dalam {timeout:.0f} detik.")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class Session:
+    """Satu klien websocket yang berperilaku seperti tab browser dashboard."""
+
+    def __init__(self, base_url, session_id, seed, timeout):
+        self.stream_url = base_url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+        self.session_id = session_id
+        self.rng = random.Random(seed)
+        self.timeout = timeout
+        self.websocket = None
+        self.latencies = []
+        self.errors = []
+        self.widgets = {}
+        self.states = {}
+        self.pages = {}
+        self.page_hash = ""
+
+    async def __aenter__(self):
+        import websockets
+
+        self.websocket = await websockets.connect(self.stream_url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.websocket.close()
+
+    async def _send_rerun(self):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        back = BackMsg()
+        back.rerun_script.query_string = ""
+        back.rerun_script.page_script_hash = self.page_hash
+        back.rerun_script.widget_states.widgets.extend(self.states.values())
+        await self.websocket.send(back.SerializeToString())
+
+    async def _receive_until_finished(self):
+        """Membaca ForwardMsg sampai script selesai; mengembalikan pesan error aplikasi."""
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        errors = []
+        widgets = {}
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.websocket.recv())
+            kind = msg.WhichOneof("type")
+
+            if kind == "navigation":
+                self.pages = {page.page_name: page.page_script_hash for page in msg.navigation.app_pages}
+                self.page_hash = msg.navigation.page_script_hash
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in WIDGET_TYPES:
+                    widget = getattr(element, element_type)
+                    widgets[widget.id] = (element_type, widget)
+                elif element_type == "exception":
+                    errors.append(f"{element.exception.type}: {element.exception.message}")
+            elif kind == "script_finished":
+                if msg.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    errors.append(f"script_finished={ForwardMsg.ScriptFinishedStatus.Name(msg.script_finished)}")
+                break
+
+        self.widgets = widgets
+        # Seperti frontend: state widget yang tidak lagi dirender ikut dibuang
+        self.states = {wid: state for wid, state in self.states.items() if wid in widgets}
+        return errors
+
+    async def rerun(self, action):
+        """Mengirim satu rerun dan mencatat latensinya sampai script selesai."""
+        start = time.perf_counter()
+        try:
+            await self._send_rerun()
+            errors = await asyncio.wait_for(self._receive_until_finished(), self.timeout)
+        except Exception as e:
+            self.errors.append(f"{action}: {e!r}")
+            return False
+        self.latencies.append((action, time.perf_counter() - start))
+        self.errors.extend(f"{action}: {error}" for error in errors)
+        return not errors
+
+    def find_widget(self, element_type, key=None, label=None):
+        for widget_id, (kind, widget) in self.widgets.items():
+            if kind != element_type:
+                continue
+            if (key is not None and widget_id.endswith(f"-{key}")) or (label is not None and widget.label == label):
+                return widget
+        raise LookupError(f"Widget {element_type} key={key!r} label={label!r} tidak ditemukan.")
+
+    def set_state(self, widget, **value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        state = WidgetState(id=widget.id)
+        for field, data in value.items():
+            if field.endswith("_array_value"):
+                getattr(state, field).data[:] = data
+            else:
+                setattr(state, field, data)
+        self.states[widget.id] = state
+
+    async def change_date_range(self):
+        start_widget = self.find_widget("date_input", key="start_date_filter")
+        min_date = datetime.date.fromisoformat(start_widget.min)
+        max_date = datetime.date.fromisoformat(start_widget.max)
+        start = min_date + datetime.timedelta(days=self.rng.randint(0, (max_date - min_date).days))
+        end = start + datetime.timedelta(days=self.rng.randint(0, (max_date - start).days))
+
+        self.set_state(start_widget, string_array_value=[start.isoformat()])
+        if await self.rerun("date_start"):
+            end_widget = self.find_widget("date_input", key="end_date_filter")
+            self.set_state(end_widget, string_array_value=[end.isoformat()])
+            await self.rerun("date_end")
+
+    async def change_multiselect(self):
+        widget = self.find_widget("multiselect", label=self.rng.choice(MULTISELECT_LABELS))
+        options = list(widget.options)
+        selection = self.rng.sample(options, self.rng.randint(0, min(3, len(options))))
+        self.set_state(widget, string_array_value=selection)
+        await self.rerun("multiselect")
+
+    async def change_crosstab(self):
+        widget = self.find_widget("selectbox", key=self.rng.choice(CROSSTAB_KEYS))
+        # Selectbox mengirim label opsi yang sudah diformat, seperti frontend
+        self.set_state(widget, string_value=self.rng.choice(list(widget.options)))
+        await self.rerun("crosstab")
+
+    async def visit_page(self):
+        self.page_hash = self.pages[self.rng.choice(OTHER_PAGES)]
+        if await self.rerun("page"):
+            self.page_hash = self.pages[DASHBOARD_PAGE]
+            await self.rerun("page")
+
+    async def play(self, actions, think_time=0.0):
+        """Memuat dashboard lalu menjalankan ``actions`` interaksi acak."""
+        if not await self.rerun(PAGE_LOAD):
+            return
+
+        steps = [
+            (self.change_date_range, 4),
+            (self.change_multiselect, 4),
+            (self.change_crosstab, 1),
+            (self.visit_page, 1),
+        ]
+        for _ in range(actions):
+            if think_time:
+                await asyncio.sleep(self.rng.uniform(0, think_time))
+            step = self.rng.choices([s for s, _ in steps], weights=[w for _, w in steps])[0]
+            try:
+                await step()
+            except LookupError as e:
+                # Widget hilang (rerun gagal atau Dashboard berubah); hentikan sesi ini
+                self.errors.append(f"{step.__name__}: {e}")
+                return
+
+
+async def run_session(base_url, session_id, options):
+    """Menjalankan satu sesi dan mengembalikan latensi serta error-nya."""
+    session = Session(base_url, session_id, options["seed"] + session_id, options["timeout"])
+    try:
+        async with session:
+            await session.play(options["actions"], options.get("think_time", 0.0))
+    except Exception as e:
+        session.errors.append(f"koneksi: {e!r}")
+    return {
+        "session": session_id,
+        "latencies": session.latencies,
+        "errors": [f"sesi {session_id}: {e}" for e in session.errors],
+    }
+
+
+async def run_load(base_url, sessions, options):
+    """Memanaskan cache dengan satu sesi, lalu menjalankan semua sesi bersamaan."""
+    warmup = Session(base_url, -1, options["seed"], options["timeout"])
+    try:
+        async with warmup:
+            await warmup.rerun(COLD_START)
+    except Exception as e:
+        warmup.errors.append(f"koneksi: {e!r}")
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_session(base_url, i, options) for i in range(sessions)))
+    wall_time = time.perf_counter() - start
+
+    results.append({
+        "session": "warmup",
+        "latencies": warmup.latencies,
+        "errors": [f"warmup: {e}" for e in warmup.errors],
+    })
+    return results, wall_time
+
+
+def summarize(results, wall_time, server_pid=None):
+    """Menggabungkan hasil semua sesi menjadi ringkasan metrik."""
+    by_action = {}
+    for r in results:
+        for action, seconds in r["latencies"]:
+            by_action.setdefault(action, []).append(seconds)
+    interactive = [
+        seconds for action, values in by_action.items()
+        if action not in (COLD_START, PAGE_LOAD) for seconds in values
+    ]
+
+    def stats(values):
+        return {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+
+    return {
+        "wall_time_s": wall_time,
+        "cold_start_s": by_action.get(COLD_START, [float("nan")])[0],
+        "page_load_s": stats(by_action.get(PAGE_LOAD, [])),
+        "interactive_reruns": len(interactive),
+        "throughput_rps": len(interactive) / wall_time if wall_time else 0.0,
+        "latency_s": stats(interactive),
+        "latency_by_action_s": {action: stats(values) for action, values in sorted(by_action.items())},
+        "memory_mb": {
+            "server_pid": server_pid,
+            "server_peak_rss": peak_rss_mb(server_pid) if server_pid else None,
+            "harness_peak_rss": peak_rss_mb(),
+        },
+        "errors": [e for r in results for e in r["errors"]],
+    }
+
+
+def print_report(summary):
+    latency = summary["latency_s"]
+    page_load = summary["page_load_s"]
+    memory = summary["memory_mb"]
+    print(f"Cold start   : {summary['cold_start_s']:.3f} s (cache kosong)")
+    print(f"Page load    : p50={page_load['p50']:.3f}  p95={page_load['p95']:.3f}  p99={page_load['p99']:.3f}")
+    print(f"Rerun        : {summary['interactive_reruns']} interaktif dalam {summary['wall_time_s']:.1f} s")
+    print(f"Throughput   : {summary['throughput_rps']:.2f} rerun/s")
+    print(f"Latensi (s)  : p50={latency['p50']:.3f}  p95={latency['p95']:.3f}  p99={latency['p99']:.3f}")
+    for action, stats in summary["latency_by_action_s"].items():
+        print(f"  {action:<12} n={stats['count']:<5} p50={stats['p50']:.3f}  p95={stats['p95']:.3f}  p99={stats['p99']:.3f}")
+    if memory["server_peak_rss"] is not None:
+        print(f"Memori server (PID {memory['server_pid']}): puncak {memory['server_peak_rss']:.1f} MB")
+    print(f"Memori harness: puncak {memory['harness_peak_rss']:.1f} MB")
+    if summary["errors"]:
+        print(f"Error        : {len(summary['errors'])}")
+        for error in summary["errors"][:10]:
+            print(f"  {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test sesi Streamlit bersamaan terhadap satu server.")
+    parser.add_argument("--sessions", type=int, default=50, help="Jumlah sesi bersamaan.")
+    parser.add_argument("--actions", type=int, default=10, help="Interaksi per sesi.")
+    parser.add_argument("--think", type=float, default=0.5, help="Jeda acak maksimum antar interaksi (detik).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed skenario acak.")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Batas waktu satu rerun (detik).")
+    parser.add_argument("--url", help="Pakai server yang sudah berjalan alih-alih menjalankan main.py.")
+    parser.add_argument("--json", help="Simpan ringkasan ke file JSON.")
+    parser.add_argument("--max-p95", type=float, help="Gagal (exit 1) jika p95 rerun interaktif melebihi nilai ini (detik).")
+    args = parser.parse_args()
+
+    options = {"actions": args.actions, "seed": args.seed, "timeout": args.timeout, "think_time": args.think}
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        process, base_url = start_server()
+    try:
+        results, wall_time = asyncio.run(run_load(base_url, args.sessions, options))
+        summary = summarize(results, wall_time, server_pid=process.pid if process else None)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    print_report(summary)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+    failed = bool(summary["errors"])
+    if args.max_p95 is not None and summary["latency_s"]["p95"] > args.max_p95:
+        print(f"GAGAL: p95 {summary['latency_s']['p95']:.3f} s > batas {args.max_p95:.3f} s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
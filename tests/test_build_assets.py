@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image
+
+from scripts import build_assets
+from utils import assets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def src_dir(tmp_path):
+    src = tmp_path / "assets"
+    src.mkdir()
+    for name in build_assets.ASSET_WIDTHS:
+        shutil.copy(os.path.join(ROOT, "assets", name), src / name)
+    return src
+
+
+def test_only_stale_variants_are_removed(src_dir, tmp_path):
+    out = tmp_path / "build"
+    out.mkdir()
+    (out / "logo-108w.0123456789.png").write_bytes(b"stale")
+    (out / "catatan.txt").write_text("bukan varian")
+    (out / "subdir").mkdir()
+
+    manifest = build_assets.build_assets(str(src_dir), str(out), str(out / "manifest.json"))
+
+    remaining = set(os.listdir(out))
+    assert "logo-108w.0123456789.png" not in remaining
+    assert {"catatan.txt", "subdir", "manifest.json"} <= remaining
+    for entry in manifest.values():
+        for variant in entry.values():
+            assert variant.endswith(".webp") and variant in remaining
+
+
+def test_refuses_to_write_into_source_dir(src_dir):
+    with pytest.raises(ValueError):
+        build_assets.build_assets(str(src_dir), str(src_dir), str(src_dir / "manifest.json"))
+    assert sorted(os.listdir(src_dir)) == sorted(build_assets.ASSET_WIDTHS)
+
+
+@pytest.fixture(scope="module")
+def built(tmp_path_factory):
+    src = tmp_path_factory.mktemp("assets")
+    for name in build_assets.ASSET_WIDTHS:
+        shutil.copy(os.path.join(ROOT, "assets", name), src / name)
+    out = tmp_path_factory.mktemp("build")
+    manifest = build_assets.build_assets(str(src), str(out), str(out / "manifest.json"))
+    return out, manifest
+
+
+def test_variants_are_2x_render_width_capped_at_source(built):
+    out, manifest = built
+
+    with Image.open(out / manifest["logo.png"]["108"]) as image:
+        assert image.size == (216, 64)
+    with Image.open(out / manifest["logo.png"]["520"]) as image:
+        assert image.width == 583
+    with Image.open(out / manifest["foto_risma.png"]["150"]) as image:
+        assert image.size == (300, 300)
+
+
+def test_manifest_maps_to_existing_files(built):
+    out, _ = built
+
+    text = (out / "manifest.json").read_text()
+    assert text.endswith("\n")
+    manifest = json.loads(text)
+    assert set(manifest) == set(build_assets.ASSET_WIDTHS)
+    for name, widths in build_assets.ASSET_WIDTHS.items():
+        assert set(manifest[name]) == {str(width) for width in widths}
+        for variant in manifest[name].values():
+            assert (out / variant).is_file()
+
+
+@pytest.fixture
+def build_dir(tmp_path, monkeypatch):
+    build = tmp_path / "build"
+    build.mkdir()
+    monkeypatch.setattr(assets, "BUILD_DIR", str(build))
+    monkeypatch.setattr(assets, "MANIFEST_PATH", str(build / "manifest.json"))
+    return build
+
+
+def test_asset_variant_uses_manifest_entry(build_dir):
+    (build_dir / "logo-108w.0123456789.webp").write_bytes(b"webp")
+    (build_dir / "manifest.json").write_text(json.dumps({"logo.png": {"108": "logo-108w.0123456789.webp"}}))
+
+    assert assets.asset_variant("assets/logo.png", 108) == os.path.join(str(build_dir), "logo-108w.0123456789.webp")
+
+
+def test_asset_variant_falls_back_without_manifest(build_dir):
+    assert assets.asset_variant("assets/logo.png", 108) == "assets/logo.png"
+
+
+def test_asset_variant_falls_back_when_variant_file_missing(build_dir):
+    (build_dir / "manifest.json").write_text(json.dumps({"logo.png": {"108": "logo-108w.0123456789.webp"}}))
+
+    assert assets.asset_variant("assets/logo.png", 108) == "assets/logo.png"
+    assert assets.asset_variant("assets/logo.png", 520) == "assets/logo.png"
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.crosstab import code_column, crosstab_frame, encode_dimensions, top_k_crosstab
+
+
+def reference_crosstab(df, row, col, k_rows, k_cols):
+    """Tabulasi silang top-k versi pandas padat sebagai pembanding."""
+    valid = df.dropna(subset=[row, col])
+    full = pd.crosstab(valid[row], valid[col])
+    rows = full.sum(axis=1)
+    cols = full.sum(axis=0)
+    # Urutan baris: total menurun, seri diputus urutan label
+    rows = rows.iloc[np.lexsort((np.arange(len(rows)), -rows.to_numpy()))].head(k_rows)
+    cols = cols.iloc[np.lexsort((np.arange(len(cols)), -cols.to_numpy()))]
+    cols = cols.head(k_cols) if k_cols is not None else cols
+    return full.loc[rows.index, sorted(cols.index)]
+
+
+def random_frame(rng, n, n_rows, n_cols, nan_rate):
+    row = rng.choice([f"r{i:03d}" for i in range(n_rows)], n).astype(object)
+    col = rng.choice([f"c{i:02d}" for i in range(n_cols)], n).astype(object)
+    row[rng.random(n) < nan_rate] = np.nan
+    col[rng.random(n) < nan_rate] = np.nan
+    return pd.DataFrame({"row": row, "col": col})
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_matches_pandas_crosstab(seed):
+    rng = np.random.default_rng(seed)
+    df = random_frame(
+        rng,
+        n=int(rng.integers(0, 2000)),
+        n_rows=int(rng.integers(1, 300)),
+        n_cols=int(rng.integers(1, 20)),
+        nan_rate=float(rng.choice([0.0, 0.05, 0.3])),
+    )
+    labels = encode_dimensions(df, ["row", "col"])
+    k_rows = int(rng.integers(1, 15))
+    k_cols = None if rng.random() < 0.5 else int(rng.integers(1, 15))
+
+    # Subset acak meniru df_final hasil filter sidebar
+    subset = df[rng.random(len(df)) < 0.7]
+    got = crosstab_frame(subset, labels, "row", "col", k_rows=k_rows, k_cols=k_cols)
+    expected = reference_crosstab(subset, "row", "col", k_rows, k_cols)
+
+    assert list(got.index) == list(expected.index)
+    assert list(got.columns) == list(expected.columns)
+    np.testing.assert_array_equal(got.to_numpy(), expected.to_numpy())
+
+
+def test_row_totals_exclude_nan_columns():
+    df = pd.DataFrame({
+        "row": ["a", "a", "a", "b", "b"],
+        "col": [np.nan, np.nan, "x", "x", "x"],
+    })
+    labels = encode_dimensions(df, ["row", "col"])
+    got = crosstab_frame(df, labels, "row", "col", k_rows=1)
+    # "a" lebih sering secara value_counts, tetapi dua barisnya NaN di kolom
+    assert list(got.index) == ["b"]
+
+
+def test_encode_dimensions_uses_smallest_dtype():
+    df = pd.DataFrame({"small": ["a", "b", np.nan], "wide": [f"v{i}" for i in range(3)]})
+    df = pd.concat([df, pd.DataFrame({"wide": [f"w{i}" for i in range(200)]})], ignore_index=True)
+    encode_dimensions(df, ["small", "wide", "missing"])
+    assert df[code_column("small")].dtype == np.int8
+    assert df[code_column("wide")].dtype == np.int16
+    assert df[code_column("small")].iloc[2] == -1
+    assert code_column("missing") not in df.columns
+
+
+def test_empty_input():
+    counts, row_idx, col_idx = top_k_crosstab(np.array([], dtype=np.int8), np.array([], dtype=np.int8), 3, 2)
+    assert counts.shape == (0, 0)
+    assert len(row_idx) == 0 and len(col_idx) == 0
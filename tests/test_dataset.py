@@ -0,0 +1,229 @@
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import dataset
+from utils.dataset import DownloadError, HTTPSource, fetch_dataset
+
+CHUNK = 64 * 1024
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Stand-in HTTP lokal yang melayani ``Range`` seperti Google Drive."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        with server.lock:
+            server.requests.append(self.headers.get("Range"))
+
+        if match and server.supports_ranges:
+            start, end = map(int, match.groups())
+            if start in server.failing_starts:
+                self.send_error(503)
+                return
+            body = server.data[start:end + 1]
+            truncate = server.truncate_body or start in server.truncate_once_starts
+            server.truncate_once_starts.discard(start)
+            if server.chunked:
+                self.protocol_version = "HTTP/1.1"
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(server.data)}")
+        else:
+            body = server.data
+            truncate = server.truncate_body
+            if server.chunked:
+                self.protocol_version = "HTTP/1.1"
+            self.send_response(200)
+
+        self.send_header("Content-Type", server.content_type)
+        self.send_header("ETag", '"v1"')
+        if server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Connection", "close")
+        elif server.send_length:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if truncate:
+            body = body[:len(body) // 2]
+        if server.chunked:
+            for offset in range(0, len(body), 16 * 1024):
+                block = body[offset:offset + 16 * 1024]
+                self.wfile.write(f"{len(block):x}\r\n".encode() + block + b"\r\n")
+            if not truncate:
+                self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.wfile.write(body)
+        self.close_connection = True
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.data = os.urandom(5 * CHUNK + 123)
+    httpd.requests = []
+    httpd.lock = threading.Lock()
+    httpd.failing_starts = set()
+    httpd.supports_ranges = True
+    httpd.send_length = True
+    httpd.truncate_body = False
+    httpd.truncate_once_starts = set()
+    httpd.chunked = False
+    httpd.content_type = "text/csv"
+    httpd.url = f"http://127.0.0.1:{httpd.server_port}/crime_data_clean.csv"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(dataset.time, "sleep", lambda seconds: None)
+
+
+def ranged_requests(server):
+    return [r for r in server.requests if r and r != "bytes=0-0"]
+
+
+def test_ranged_download(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    sha256 = hashlib.sha256(server.data).hexdigest()
+
+    fetch_dataset(HTTPSource(server.url), str(dest), sha256=sha256, chunk_size=CHUNK)
+
+    assert dest.read_bytes() == server.data
+    assert len(ranged_requests(server)) == 6
+    assert not (tmp_path / "data.csv.part").exists()
+    assert not (tmp_path / "data.csv.part.json").exists()
+
+
+def test_resume_after_failed_chunk(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.failing_starts = {2 * CHUNK}
+
+    with pytest.raises(OSError):
+        fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+    assert not dest.exists()
+    assert (tmp_path / "data.csv.part.json").exists()
+
+    server.failing_starts = set()
+    server.requests.clear()
+    fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+
+    assert dest.read_bytes() == server.data
+    # Hanya chunk yang gagal yang diminta ulang
+    assert ranged_requests(server) == [f"bytes={2 * CHUNK}-{3 * CHUNK - 1}"]
+
+
+def test_bad_checksum_is_rejected(server, tmp_path):
+    dest = tmp_path / "data.csv"
+
+    with pytest.raises(DownloadError):
+        fetch_dataset(HTTPSource(server.url), str(dest), sha256="0" * 64, chunk_size=CHUNK)
+
+    assert not dest.exists()
+    assert not (tmp_path / "data.csv.part").exists()
+    assert not (tmp_path / "data.csv.part.json").exists()
+
+
+def test_concurrent_callers_download_once(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    errors = []
+
+    def worker():
+        try:
+            fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert dest.read_bytes() == server.data
+    assert server.requests.count("bytes=0-0") == 1
+    assert len(ranged_requests(server)) == 6
+
+
+def test_truncated_stream_without_size_or_checksum_is_rejected(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.supports_ranges = False
+    server.send_length = False
+    server.truncate_body = True
+
+    with pytest.raises(DownloadError):
+        fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+
+    assert not dest.exists()
+
+
+def test_stream_without_size_is_verified_by_checksum(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.supports_ranges = False
+    server.send_length = False
+    sha256 = hashlib.sha256(server.data).hexdigest()
+
+    fetch_dataset(HTTPSource(server.url), str(dest), sha256=sha256, chunk_size=CHUNK)
+    assert dest.read_bytes() == server.data
+
+    server.truncate_body = True
+    other = tmp_path / "other.csv"
+    with pytest.raises(DownloadError):
+        fetch_dataset(HTTPSource(server.url), str(other), sha256=sha256, chunk_size=CHUNK)
+    assert not other.exists()
+
+
+def test_html_interstitial_is_rejected(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.content_type = "text/html"
+
+    with pytest.raises(DownloadError, match="HTML"):
+        HTTPSource(server.url).probe()
+    with pytest.raises(DownloadError):
+        fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+    assert not dest.exists()
+
+
+def test_chunked_stream_without_size_or_checksum_is_installed(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.supports_ranges = False
+    server.chunked = True
+
+    fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+    assert dest.read_bytes() == server.data
+
+
+def test_truncated_chunked_stream_raises_download_error(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.supports_ranges = False
+    server.chunked = True
+    server.truncate_body = True
+
+    # IncompleteRead harus muncul sebagai DownloadError, bukan HTTPException mentah
+    with pytest.raises(DownloadError):
+        fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+    assert not dest.exists()
+
+
+def test_truncated_chunked_range_is_retried(server, tmp_path):
+    dest = tmp_path / "data.csv"
+    server.chunked = True
+    server.truncate_once_starts = {3 * CHUNK}
+
+    fetch_dataset(HTTPSource(server.url), str(dest), chunk_size=CHUNK)
+
+    assert dest.read_bytes() == server.data
+    assert ranged_requests(server).count(f"bytes={3 * CHUNK}-{4 * CHUNK - 1}") == 2
@@ -0,0 +1,116 @@
+import asyncio
+import csv
+import datetime
+import os
+import random
+import shutil
+
+import pytest
+
+from scripts import loadtest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("n, q, expected_rank", [
+    (100, 95, 95),
+    (100, 99, 99),
+    (10, 50, 5),
+    (20, 95, 19),
+    (20, 50, 10),
+    (1, 99, 1),
+    (3, 0, 1),
+    (3, 100, 3),
+])
+def test_percentile_is_nearest_rank(n, q, expected_rank):
+    values = list(range(1, n + 1))
+    assert loadtest.percentile(values[::-1], q) == expected_rank
+
+
+def test_percentile_of_empty_is_nan():
+    assert loadtest.percentile([], 50) != loadtest.percentile([], 50)
+
+
+def test_gate_excludes_cold_start_and_page_load():
+    results = [{
+        "session": 0,
+        "latencies": [("cold_start", 30.0), ("page_load", 20.0), ("date_start", 1.0), ("multiselect", 2.0)],
+        "errors": [],
+    }]
+    summary = loadtest.summarize(results, wall_time=10.0)
+
+    assert summary["cold_start_s"] == 30.0
+    assert summary["page_load_s"]["p95"] == 20.0
+    assert summary["interactive_reruns"] == 2
+    assert summary["latency_s"]["p95"] == 2.0
+
+
+def write_fixture_csv(path, rows=300):
+    rng = random.Random(0)
+    fields = [
+        "occurrence_date", "occurrence_time", "victim_gender", "victim_ethnicity", "weapon",
+        "victim_age", "latitude", "longitude", "area", "crime_category", "crime", "premise",
+    ]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for _ in range(rows):
+            writer.writerow([
+                (datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 700))).isoformat(),
+                f"{rng.randint(0, 23)}:{rng.randint(0, 59):02d}",
+                rng.choice(["M", "F", "Unknown"]),
+                rng.choice(["Hispanic", "White", "Black"]),
+                rng.choice(["STRONG-ARM", "KNIFE", " "]),
+                rng.randint(0, 80),
+                34 + rng.random(),
+                -118 + rng.random(),
+                rng.choice(["Central", "Hollywood", "Pacific"]),
+                rng.choice(["Assault", "Theft", "Burglary"]),
+                rng.choice(["BATTERY", "THEFT", "ROBBERY"]),
+                rng.choice(["STREET", "PARKING LOT", "SINGLE FAMILY DWELLING"]),
+            ])
+
+
+@pytest.fixture(scope="module")
+def server_url(tmp_path_factory):
+    pytest.importorskip("streamlit")
+    pytest.importorskip("websockets")
+
+    app_root = tmp_path_factory.mktemp("app")
+    shutil.copy(os.path.join(ROOT, "main.py"), app_root)
+    for directory in ("pages", "utils", "assets"):
+        shutil.copytree(os.path.join(ROOT, directory), app_root / directory,
+                        ignore=shutil.ignore_patterns("__pycache__"))
+    (app_root / "dataset").mkdir()
+    write_fixture_csv(app_root / "dataset" / "crime_data_clean.csv")
+
+    process, url = loadtest.start_server(app_root=str(app_root))
+    yield url
+    loadtest.stop_server(process)
+
+
+def test_run_session_drives_dashboard(server_url):
+    options = {"actions": 2, "seed": 0, "timeout": 60}
+    result = asyncio.run(loadtest.run_session(server_url, 0, options))
+
+    assert result["errors"] == []
+    actions = [action for action, _ in result["latencies"]]
+    assert actions[0] == loadtest.PAGE_LOAD
+    assert len(actions) > 1
+
+
+def test_every_step_finds_its_widgets(server_url):
+    async def play():
+        async with loadtest.Session(server_url, 0, seed=1, timeout=60) as session:
+            assert await session.rerun(loadtest.PAGE_LOAD)
+            await session.change_date_range()
+            await session.change_multiselect()
+            await session.change_crosstab()
+            await session.visit_page()
+            return session
+
+    session = asyncio.run(play())
+
+    assert session.errors == []
+    actions = {action for action, _ in session.latencies}
+    assert {"date_start", "date_end", "multiselect", "crosstab", "page"} <= actions
@@ -0,0 +1,47 @@
+import functools
+import json
+import os
+
+ASSET_DIR = "assets"
+BUILD_DIR = os.path.join(ASSET_DIR, "build")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+
+# Lebar tampilan (piksel CSS) tiap aset sesuai pemakaiannya di halaman
+ASSET_WIDTHS = {
+    "logo.png": [108, 520],  # st.logo(size="large") di sidebar & logo halaman Kontak
+    "foto_risma.png": [150],
+    "foto_sopian.png": [150],
+    "foto_zulhi.png": [150],
+}
+
+# Varian dibuat 2x lebar tampilan agar tetap tajam di layar HiDPI
+RENDER_SCALE = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _load_manifest(manifest_path):
+    """Membaca manifest hasil build aset; kosong jika build belum dijalankan."""
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def asset_variant(path, width):
+    """Path varian teroptimasi untuk ``path`` pada lebar tampilan ``width``.
+
+    Jika tidak ada varian di manifest (atau file varian hilang), path asli
+    dikembalikan sehingga halaman tetap berjalan tanpa langkah build.
+    """
+    name = _load_manifest(MANIFEST_PATH).get(os.path.basename(path), {}).get(str(width))
+    if name and os.path.exists(os.path.join(BUILD_DIR, name)):
+        return os.path.join(BUILD_DIR, name)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def load_asset(path, width):
+    """Membaca bytes aset (varian teroptimasi bila ada) dan menyimpannya di memori proses."""
+    with open(asset_variant(path, width), "rb") as f:
+        return f.read()
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+# Dimensi yang dapat dipilih untuk tabulasi silang (kolom -> label tampilan)
+CROSSTAB_DIMENSIONS = {
+    'premise': 'Tempat Kejadian (Premise)',
+    'crime_category': 'Kategori Kejahatan',
+    'crime': 'Jenis Kejahatan',
+    'weapon': 'Senjata',
+    'area': 'Area',
+    'victim_age_group': 'Kelompok Usia Korban',
+    'victim_gender': 'Gender Korban',
+    'victim_ethnicity': 'Etnis Korban',
+    'occurrence_hour': 'Jam Kejadian',
+    'day_of_week': 'Hari',
+}
+
+CODE_SUFFIX = '__code'
+
+
+def code_column(column_name):
+    """Nama kolom yang menyimpan kode integer untuk sebuah dimensi."""
+    return f"{column_name}{CODE_SUFFIX}"
+
+
+def encode_dimensions(df, columns):
+    """Menambahkan kolom kode integer untuk setiap dimensi dan mengembalikan labelnya.
+
+    Kode dibuat sekali (saat data dimuat) dengan tipe integer terkecil yang
+    cukup, sehingga setiap baris hasil filter tetap membawa kodenya tanpa
+    perlu di-hash ulang. Nilai kosong (NaN) diberi kode -1.
+    """
+    labels = {}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[col], sort=True)
+        dtype = np.int8 if len(uniques) < np.iinfo(np.int8).max else (
+            np.int16 if len(uniques) < np.iinfo(np.int16).max else np.int32
+        )
+        df[code_column(col)] = codes.astype(dtype)
+        labels[col] = np.asarray(uniques)
+    return labels
+
+
+def _top_k(totals, k):
+    """Indeks k label dengan total terbesar (urut menurun, seri diputus urutan label, total nol dibuang)."""
+    nonzero = np.flatnonzero(totals)
+    if k is not None and k < len(nonzero):
+        # partition hanya menyentuh kardinalitas label, bukan jumlah baris;
+        # nilai seri di batas top-k diputus dengan urutan label
+        values = totals[nonzero]
+        kth = np.partition(values, len(values) - k)[len(values) - k]
+        above = nonzero[values > kth]
+        tied = nonzero[values == kth][:k - len(above)]
+        nonzero = np.concatenate([above, tied])
+    return nonzero[np.lexsort((nonzero, -totals[nonzero]))]
+
+
+def top_k_crosstab(row_codes, col_codes, n_rows, n_cols, k_rows=10, k_cols=None):
+    """Tabulasi silang top-k dari dua array kode integer.
+
+    Total per baris dan per kolom dihitung dengan ``np.bincount``, lalu hanya
+    pasangan yang masuk top-k yang direduksi ke matriks ``k_rows x k_cols``.
+    Tidak ada tabel padat selebar kardinalitas penuh yang dibentuk, sehingga
+    memori tetap kecil untuk pasangan dimensi berkardinalitas tinggi.
+
+    Pasangan dengan kode -1 (NaN) di salah satu dimensi dibuang sebelum
+    total dihitung, sama seperti ``pd.crosstab``. Akibatnya total top-k baris
+    tidak menghitung baris yang dimensi kolomnya NaN, sedikit berbeda dari
+    ``value_counts()`` pada dimensi baris saja.
+
+    Mengembalikan ``(counts, row_idx, col_idx)``: baris diurutkan menurun
+    berdasarkan total, kolom diurutkan sesuai urutan label.
+    """
+    row_codes = np.asarray(row_codes)
+    col_codes = np.asarray(col_codes)
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    row_codes = row_codes[valid].astype(np.intp, copy=False)
+    col_codes = col_codes[valid].astype(np.intp, copy=False)
+
+    row_idx = _top_k(np.bincount(row_codes, minlength=n_rows), k_rows)
+    col_idx = np.sort(_top_k(np.bincount(col_codes, minlength=n_cols), k_cols))
+
+    # Peta kode asli -> posisi di matriks hasil (-1 = tidak termasuk top-k)
+    row_map = np.full(n_rows, -1, dtype=np.intp)
+    row_map[row_idx] = np.arange(len(row_idx))
+    col_map = np.full(n_cols, -1, dtype=np.intp)
+    col_map[col_idx] = np.arange(len(col_idx))
+
+    r = row_map[row_codes]
+    c = col_map[col_codes]
+    keep = (r >= 0) & (c >= 0)
+    size = len(row_idx) * len(col_idx)
+    counts = np.bincount(r[keep] * len(col_idx) + c[keep], minlength=size)
+    return counts.reshape(len(row_idx), len(col_idx)), row_idx, col_idx
+
+
+def crosstab_frame(df, labels, row, col, k_rows=10, k_cols=None):
+    """Tabulasi silang top-k antara dua dimensi ``df`` sebagai DataFrame kecil."""
+    counts, row_idx, col_idx = top_k_crosstab(
+        df[code_column(row)].to_numpy(),
+        df[code_column(col)].to_numpy(),
+        len(labels[row]),
+        len(labels[col]),
+        k_rows=k_rows,
+        k_cols=k_cols,
+    )
+    return pd.DataFrame(
+        counts,
+        index=pd.Index(labels[row][row_idx], name=row),
+        columns=pd.Index(labels[col][col_idx], name=col),
+    )
@@ -0,0 +1,235 @@
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 8 * 1024 * 1024
+MAX_WORKERS = 4
+MAX_RETRIES = 3
+BLOCK_SIZE = 64 * 1024
+
+
+class DownloadError(Exception):
+    """Unduhan dataset gagal atau hasilnya tidak valid."""
+
+
+class HTTPSource:
+    """Sumber dataset berbasis HTTP(S) yang mendukung permintaan ``Range``.
+
+    Sumber lain (misalnya server HTTP lokal untuk pengujian) cukup
+    menyediakan ``probe()`` dan ``open_range()`` dengan perilaku yang sama.
+    """
+
+    def __init__(self, url, timeout=60):
+        self.url = url
+        self.timeout = timeout
+
+    def _request(self, headers=None):
+        request = urllib.request.Request(self.url, headers=headers or {})
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except http.client.HTTPException as e:
+            # Misalnya BadStatusLine: bukan OSError, jadi dibungkus agar bisa di-retry
+            raise DownloadError(f"Respons HTTP tidak valid dari {self.url}: {e!r}") from e
+
+    def probe(self):
+        """Mengembalikan ``(size, supports_ranges, validator)`` dari sumber."""
+        with self._request({"Range": "bytes=0-0"}) as response:
+            if response.headers.get_content_type() == "text/html":
+                raise DownloadError(f"Sumber {self.url} mengembalikan halaman HTML, bukan file dataset.")
+
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            content_range = response.headers.get("Content-Range", "")
+            match = re.match(r"bytes \d+-\d+/(\d+)", content_range)
+            if response.status == 206 and match:
+                return int(match.group(1)), True, validator
+
+            length = response.headers.get("Content-Length")
+            return (int(length) if length else None), False, validator
+
+    def open_range(self, start=None, end=None):
+        """Membuka stream untuk byte ``start..end`` (inklusif), atau seluruh file."""
+        if start is None:
+            return self._request()
+        response = self._request({"Range": f"bytes={start}-{end}"})
+        if response.status != 206:
+            response.close()
+            raise DownloadError(f"Sumber tidak melayani permintaan Range untuk byte {start}-{end}.")
+        return response
+
+
+class FileLock:
+    """Kunci lintas proses berbasis file agar hanya satu worker yang mengunduh."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_CREAT | os.O_RDWR)
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.5)
+        else:
+            import fcntl
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+def file_sha256(path):
+    """Menghitung SHA-256 sebuah file secara streaming."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _copy_stream(response, f, expected=None):
+    """Menyalin isi response ke file ``f`` dan mengembalikan jumlah byte."""
+    written = 0
+    try:
+        for block in iter(lambda: response.read(BLOCK_SIZE), b""):
+            f.write(block)
+            written += len(block)
+    except http.client.HTTPException as e:
+        # IncompleteRead dll. saat koneksi terputus di tengah body
+        raise DownloadError(f"Unduhan terputus setelah {written} byte: {e!r}") from e
+    if expected is not None and written != expected:
+        raise DownloadError(f"Unduhan terpotong: {written} dari {expected} byte.")
+    return written
+
+
+def _load_state(state_path, size, validator, chunk_size):
+    """Membaca daftar chunk yang sudah selesai jika cocok dengan sumber saat ini."""
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+    if (state.get("size"), state.get("validator"), state.get("chunk_size")) != (size, validator, chunk_size):
+        return set()
+    return set(state.get("done", []))
+
+
+def _download_ranged(source, part_path, state_path, size, validator, chunk_size, max_workers):
+    """Mengunduh chunk paralel ke ``part_path`` dan mencatat progres untuk resume."""
+    done = _load_state(state_path, size, validator, chunk_size)
+    if not done or not os.path.exists(part_path):
+        done = set()
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+    chunks = [
+        (index, start, min(start + chunk_size, size) - 1)
+        for index, start in enumerate(range(0, size, chunk_size))
+        if index not in done
+    ]
+    state_lock = threading.Lock()
+
+    def fetch(chunk):
+        index, start, end = chunk
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                with source.open_range(start, end) as response, open(part_path, "r+b") as f:
+                    f.seek(start)
+                    _copy_stream(response, f, expected=end - start + 1)
+                    f.flush()
+                    os.fsync(f.fileno())
+                break
+            except (OSError, DownloadError):
+                if attempt == MAX_RETRIES:
+                    raise
+                time.sleep(attempt)
+
+        with state_lock:
+            done.add(index)
+            with open(state_path, "w") as f:
+                json.dump({"size": size, "validator": validator, "chunk_size": chunk_size, "done": sorted(done)}, f)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() memastikan exception dari worker diteruskan ke pemanggil
+        list(executor.map(fetch, chunks))
+
+
+def _download_stream(source, part_path, size, sha256):
+    """Mengunduh seluruh file dalam satu stream (sumber tanpa dukungan Range)."""
+    with source.open_range() as response:
+        # Tanpa ukuran, body chunked tetap terdeteksi bila terpotong (IncompleteRead);
+        # body yang hanya diakhiri penutupan koneksi tidak, kecuali ada checksum
+        if size is None and sha256 is None and not getattr(response, "chunked", False):
+            raise DownloadError("Sumber tidak memberikan ukuran file dan checksum tidak diketahui; unduhan tidak dapat diverifikasi.")
+        with open(part_path, "wb") as f:
+            _copy_stream(response, f, expected=size)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def fetch_dataset(source, dest, sha256=None, chunk_size=CHUNK_SIZE, max_workers=MAX_WORKERS):
+    """Mengunduh dataset ke ``dest`` secara aman dan idempoten.
+
+    - Hanya satu proses yang mengunduh (kunci ``dest + '.lock'``); proses lain
+      menunggu lalu memakai file yang sudah terpasang.
+    - Chunk diunduh paralel ke ``dest + '.part'`` dan dapat dilanjutkan setelah
+      proses terhenti.
+    - File diverifikasi (ukuran dan, bila diberikan, SHA-256) sebelum dipindah
+      ke ``dest`` dengan ``os.replace`` sehingga ``dest`` tidak pernah berisi
+      file yang terpotong. Jika sumber tidak memberikan ukuran, ``sha256``
+      tidak diberikan, dan body tidak memakai transfer chunked, unduhan
+      ditolak dengan ``DownloadError`` karena kelengkapannya tidak bisa
+      dipastikan.
+    """
+    dest_dir = os.path.dirname(dest)
+    if dest_dir:
+        os.makedirs(dest_dir, exist_ok=True)
+
+    part_path = dest + ".part"
+    state_path = dest + ".part.json"
+
+    with FileLock(dest + ".lock"):
+        if os.path.exists(dest):
+            return dest
+
+        size, supports_ranges, validator = source.probe()
+        if supports_ranges and size:
+            _download_ranged(source, part_path, state_path, size, validator, chunk_size, max_workers)
+        else:
+            _download_stream(source, part_path, size, sha256)
+
+        if size is not None and os.path.getsize(part_path) != size:
+            raise DownloadError(f"Ukuran file {os.path.getsize(part_path)} tidak sesuai dengan {size} byte.")
+
+        if sha256 is not None:
+            actual = file_sha256(part_path)
+            if actual.lower() != sha256.lower():
+                # File rusak tidak boleh dilanjutkan pada percobaan berikutnya
+                for path in (part_path, state_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                raise DownloadError(f"Checksum tidak cocok: {actual} (diharapkan {sha256}).")
+
+        os.replace(part_path, dest)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
+    return dest